@@ -28,7 +28,9 @@ Requirements:
 """
 
 import os
+import shlex
 import subprocess
+from contextlib import ExitStack
 from pathlib import Path
 import sys
 
@@ -65,18 +67,24 @@ def run_kiss_icp():
         str(KITTI_ROOT),
     ]
 
-    print("Running:", " ".join(cmd))
+    print("Running:", shlex.join(cmd))
     subprocess.run(cmd, env=env, check=True)
 
 def find_latest_run_dir() -> Path:
     latest = OUT_ROOT / "latest"
-    if latest.exists():
+    if os.path.islink(latest) and latest.exists():
         return latest.resolve(strict=False)
 
-    dirs = [p for p in OUT_ROOT.iterdir() if p.is_dir()]
+    # is_dir() comes from d_type, so only directories get stat'd, once each.
+    with os.scandir(OUT_ROOT) as it:
+        dirs = [
+            (e.stat().st_mtime, e.path)
+            for e in it
+            if e.is_dir(follow_symlinks=False)
+        ]
     if not dirs:
         raise FileNotFoundError(f"No run directories found in {OUT_ROOT}")
-    return max(dirs, key=lambda p: p.stat().st_mtime)
+    return Path(max(dirs)[1])
 
 def evaluate_with_evo(run_dir: Path):
     """
@@ -135,17 +143,27 @@ def evaluate_with_evo(run_dir: Path):
         "--save_plot", str(results_dir / f"traj_{SEQ}.png")
     ]
 
-    print("\nRunning EVO APE:", " ".join(ape_cmd))
-    with open(results_dir / "ape_stats.txt", "w") as f:
-        subprocess.run(ape_cmd, check=True, stdout=f, stderr=subprocess.STDOUT)
-
-    print("Running EVO RPE:", " ".join(rpe_cmd))
-    with open(results_dir / "rpe_stats.txt", "w") as f:
-        subprocess.run(rpe_cmd, check=True, stdout=f, stderr=subprocess.STDOUT)
+    jobs = [
+        ("APE", ape_cmd, results_dir / "ape_stats.txt"),
+        ("RPE", rpe_cmd, results_dir / "rpe_stats.txt"),
+        ("TRAJ", traj_cmd, results_dir / "traj_stats.txt"),
+    ]
 
-    print("Running EVO TRAJ:", " ".join(traj_cmd))
-    with open(results_dir / "traj_stats.txt", "w") as f:
-        subprocess.run(traj_cmd, check=True, stdout=f, stderr=subprocess.STDOUT)
+    # The three EVO runs are independent, so launch them together and only
+    # check exit codes once all of them have finished.
+    procs = []
+    print()
+    with ExitStack() as stack:
+        for name, cmd, stats in jobs:
+            print(f"Running EVO {name}:", shlex.join(cmd))
+            f = stack.enter_context(open(stats, "w"))
+            p = subprocess.Popen(cmd, stdout=f, stderr=subprocess.STDOUT)
+            stack.callback(p.wait)
+            procs.append((cmd, p))
+
+    for cmd, p in procs:
+        if p.returncode != 0:
+            raise subprocess.CalledProcessError(p.returncode, cmd)
 
     print("\n✅ Saved EVO outputs to:", results_dir)
     print(" -", results_dir / f"ape_{SEQ}.png")